@@ -1,11 +1,27 @@
 from urllib.parse import urljoin
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator
 import requests
 import typer
 import json
+import sys
 import re
 import csv
+import atexit
+import hashlib
+import os
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; fall back to the stdlib json module
+    orjson = None
 
 
 API_CONFIG: Dict[str, Any] = {
@@ -21,58 +37,198 @@ API_CONFIG: Dict[str, Any] = {
     }
 }
 
+# on-disk response cache: seconds each endpoint's responses stay fresh
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "jobscli")
+CACHE_TTL: Dict[str, int] = {"list": 30, "search": 30, "get": 300}
+_CACHE_ENABLED = True
+
+# concurrent requests for multi-job commands; the connection pool is sized to match
+MAX_WORKERS = 10
+# page size used when a command needs more jobs than one `list` call should return
+PAGE_SIZE = 100
+
+# default skill list; you can extend as needed
+SKILLS_LIST: List[str] = [
+    "python",
+    "java",
+    "javascript",
+    "c#",
+    "php",
+    "sql",
+    "aws",
+    "docker",
+    "kubernetes",
+    "react",
+    "angular",
+]
+
+# Patterns compiled once at import instead of on every call
+_RE_REMOTE = re.compile(r"\bremoto\b|\bremote\b")
+_RE_HYBRID = re.compile(r"\bh[íi]brido\b|\bhybrid\b")
+_RE_ONSITE = re.compile(r"\bpresencial\b|\bon-?site\b|\bfísico\b")
+
+
+def _literal_trie_pattern(words: List[str]) -> str:
+    """Build a regex matching any of `words`, with shared prefixes merged.
+
+    `java|javascript` becomes `java(?:script)?`, so the engine walks a prefix
+    tree (like an Aho-Corasick automaton) instead of retrying every word at
+    each position; the gain grows with the size of the list.
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        alts = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        return "(?:" + body + ")?" if "" in node else body
+
+    return build(trie)
+
+
+# one pattern so each job's text is scanned once for every skill
+_SKILLS_ALT = re.compile(r"\b(" + _literal_trie_pattern(SKILLS_LIST) + r")\b")
+
 
 def _get_api_key() -> str:
     return API_CONFIG["api"].get("key", "")
 
 
-def _build_url(name: str) -> str:
-    api = API_CONFIG["api"]
-    endpoints = api.get("endpoints", {})
-    if name not in endpoints:
-        raise KeyError(f"Unknown endpoint: {name}")
+# URLs, base params and headers are fixed for the whole run, so build them once
+_URLS: Dict[str, str] = {
+    name: urljoin(API_CONFIG["api"]["base_url"], path)
+    for name, path in API_CONFIG["api"].get("endpoints", {}).items()
+}
+_BASE_PARAMS: Dict[str, Any] = {"api_key": _get_api_key()} if _get_api_key() else {}
+_HEADERS: Dict[str, str] = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:115.0) Gecko/20100101 Firefox/115.0",
+}
 
-    path = endpoints[name]
-    return urljoin(api["base_url"], path)
+
+def _build_url(name: str) -> str:
+    try:
+        return _URLS[name]
+    except KeyError:
+        raise KeyError(f"Unknown endpoint: {name}") from None
 
 
 def _get_headers() -> Dict[str, str]:
-    headers: Dict[str, str] = {}
-    headers.setdefault(
-        "User-Agent",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:115.0) Gecko/20100101 Firefox/115.0",
-    )
-    return headers
+    return dict(_HEADERS)
 
 
 def _get_params(extra_params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    params: Dict[str, Any] = {}
-    api_key = _get_api_key()
-    if api_key:
-        params.setdefault("api_key", api_key)
-    if extra_params:
-        params.update(extra_params)
-    return params
+    return {**_BASE_PARAMS, **(extra_params or {})}
 
-def list_jobs(limit: int):
-    params = _get_params({"limit": limit})
-    headers = _get_headers()
 
-    url = _build_url("list")
+def _build_session() -> requests.Session:
+    """Create a pooled, keep-alive session shared by every API call."""
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS, max_retries=retries)
+    session.mount("https://", adapter)
+    session.headers.update(_get_headers())
+    return session
+
+
+_SESSION = _build_session()
+atexit.register(_SESSION.close)
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
-    resp = requests.get(url, params=params, headers=headers)
+def _echo_json(data: Any) -> None:
+    """Pretty-print `data` as JSON on stdout.
 
+    With orjson the UTF-8 bytes go straight to the binary stream, skipping the
+    intermediate str that typer.echo would encode again; without it, json.dump
+    streams the document in chunks instead of building it as one string.
+    """
+    if orjson is None or not hasattr(sys.stdout, "buffer"):
+        json.dump(data, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+        return
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
+
+
+def _cache_path(url: str, params: Dict[str, Any]) -> str:
+    key = json.dumps([url, sorted(params.items())], default=str)
+    return os.path.join(CACHE_DIR, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+
+def _cached_get(name: str, params: Dict[str, Any]) -> requests.Response:
+    """GET endpoint `name`, serving a fresh on-disk copy when one exists.
+
+    Responses are kept for `CACHE_TTL[name]` seconds; `--no-cache` bypasses
+    both the read and the write.
+    """
+    url = _build_url(name)
+    ttl = CACHE_TTL.get(name, 0) if _CACHE_ENABLED else 0
+    path = _cache_path(url, params)
+
+    if ttl:
+        try:
+            if time.time() - os.path.getmtime(path) < ttl:
+                with open(path, "rb") as fh:
+                    resp = requests.Response()
+                    resp.status_code = 200
+                    resp.url = url
+                    resp.encoding = "utf-8"
+                    resp._content = fh.read()
+                    return resp
+        except OSError:
+            pass
+
+    resp = _SESSION.get(url, params=params, timeout=10)
     resp.raise_for_status()
 
+    if ttl:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # unique per call: get_jobs writes from several threads at once
+            fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(resp.content)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
     return resp
 
 
+def list_jobs(limit: int):
+    params = _get_params({"limit": limit})
+    return _cached_get("list", params)
+
+
 app = typer.Typer()
 
 
+@app.callback()
+def main(
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the on-disk response cache"),
+):
+    """Query itjobs.pt from the command line."""
+    global _CACHE_ENABLED
+    _CACHE_ENABLED = not no_cache
+
+
 def top_jobs(limit: int) -> list:
     resp = list_jobs(limit)
-    data = resp.json()
+    data = _loads(resp.content)
     jobs = _extract_jobs_from_response(data)
     return jobs
 
@@ -92,7 +248,7 @@ def top(
         typer.echo(f"Error fetching jobs: {e}", err=True)
         raise typer.Exit(code=1)
 
-    typer.echo(json.dumps(jobs, indent=2, ensure_ascii=False))
+    _echo_json(jobs)
 
     if csv_path:
         try:
@@ -110,13 +266,7 @@ def search_jobs(q: str, limit: int, extra_params: Optional[Dict[str, Any]] = Non
     params["limit"] = limit
     params["q"] = q
 
-    headers = _get_headers()
-
-    url = _build_url("search")
-    resp = requests.get(url, params=params, headers=headers)
-    resp.raise_for_status()
-    
-    return resp
+    return _cached_get("search", params)
 
 
 @app.command("search")
@@ -145,41 +295,103 @@ def search(
             extra["page"] = page
 
         resp = search_jobs(q, limit=limit, extra_params=extra)
-        data = resp.json()
+        data = _loads(resp.content)
     except Exception as e:
         typer.echo(f"Error performing search: {e}", err=True)
         raise typer.Exit(code=1)
 
-    typer.echo(json.dumps(data, indent=2, ensure_ascii=False))
+    _echo_json(data)
 
 
 def get_job(job_id: str):
     """Call the `get` endpoint to fetch job details by ID."""
     params = _get_params({"id": job_id})
-    headers = _get_headers()
-    
-    url = _build_url("get")
-    resp = requests.get(url, params=params, headers=headers)
-    resp.raise_for_status()
-    
-    return resp
+    return _cached_get("get", params)
 
 
-def extract_work_regime(job_data: Dict[str, Any]) -> str:
-    """Extract work regime (remote/hybrid/on-site/other) from job data."""
-    text = json.dumps(job_data).lower()
-    
-    # Patterns for different work regimes
-    if re.search(r"\bremoto\b|\bremote\b", text):
+def get_jobs(job_ids: List[str]) -> List[Dict[str, Any]]:
+    """Fetch several jobs concurrently over the shared session, keeping input order."""
+    def fetch(job_id: str) -> Dict[str, Any]:
+        return _loads(get_job(job_id).content)
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        return list(ex.map(fetch, job_ids))
+
+
+def _job_date(job: Dict[str, Any]) -> Optional[date]:
+    """Return the publication date of a job, or None if it can't be found."""
+    raw = job.get("publishDate") or job.get("publishedAt") or job.get("date")
+    try:
+        return date.fromisoformat(raw[:10])
+    except (TypeError, ValueError):
+        return None
+
+
+def iter_jobs_paged(limit: int, since: Optional[date] = None) -> Iterator[Dict[str, Any]]:
+    """Yield up to `limit` recent jobs from `list`, PAGE_SIZE jobs per request.
+
+    Up to MAX_WORKERS pages are in flight at once, and each page is handed
+    out as soon as it arrives while the rest are still downloading. The
+    listing is newest-first, so when `since` is given paging stops at the
+    first page that reaches older jobs.
+    """
+    page_size = min(limit, PAGE_SIZE)
+    if page_size <= 0:
+        return
+    n_pages = -(-limit // page_size)
+
+    def fetch(page: int) -> List[Dict[str, Any]]:
+        params = _get_params({"limit": page_size, "page": page})
+        return _extract_jobs_from_response(_loads(_cached_get("list", params).content))
+
+    remaining = limit
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        for start in range(1, n_pages + 1, MAX_WORKERS):
+            for page in ex.map(fetch, range(start, min(start + MAX_WORKERS, n_pages + 1))):
+                page = page[:remaining]
+                yield from page
+                remaining -= len(page)
+                # a short page means the listing is exhausted
+                if remaining <= 0 or len(page) < page_size:
+                    return
+                if since is not None:
+                    oldest = _job_date(page[-1])
+                    if oldest is not None and oldest < since:
+                        return
+
+
+def _job_text(job: Dict[str, Any]) -> str:
+    """Join the searchable text fields of a job into one lowercase string."""
+    keys = ("title", "body", "description", "location", "company", "publishDate", "date")
+    return " ".join(str(job.get(k) or "") for k in keys).lower()
+
+
+@lru_cache(maxsize=4096)
+def _regime_from_text(text: str) -> str:
+    """Classify a lowercase text blob; memoized so repeated jobs cost a dict hit."""
+    # plain substring checks are much cheaper than the regexes and rule most
+    # categories out; the regex only confirms the word boundaries
+    if "remot" in text and _RE_REMOTE.search(text):
         return "remote"
-    elif re.search(r"\bh[íi]brido\b|\bhybrid\b", text):
+    elif ("brido" in text or "hybrid" in text) and _RE_HYBRID.search(text):
         return "hybrid"
-    elif re.search(r"\bpresencial\b|\bon-?site\b|\bfísico\b", text):
+    elif ("presencial" in text or "site" in text or "sico" in text) and _RE_ONSITE.search(text):
         return "on-site"
     else:
         return "other"
 
 
+def extract_work_regime(job_data: Dict[str, Any]) -> str:
+    """Extract work regime (remote/hybrid/on-site/other) from job data."""
+    # fast path: the regime is usually stated in the title or description
+    regime = _regime_from_text(_job_text(job_data))
+    if regime == "other":
+        # slow path: scan the whole record (wrappers, nested fields, ...);
+        # ensure_ascii=False keeps "híbrido" from turning into "h\u00edbrido"
+        regime = _regime_from_text(json.dumps(job_data, ensure_ascii=False).lower())
+    return regime
+
+
 def _extract_jobs_from_response(data: Any) -> List[Dict[str, Any]]:
     """Try to find and return the list of jobs from API response data."""
     # If the response is already a list, assume it's the jobs list
@@ -201,67 +413,54 @@ def _extract_jobs_from_response(data: Any) -> List[Dict[str, Any]]:
     return []
 
 
-def _normalize_job_for_csv(job: Dict[str, Any]) -> Dict[str, Any]:
-    """Extract the CSV fields from a job dict safely.
+# CSV columns and the job keys tried (in order) to fill each one
+_CSV_KEYGROUPS = (
+    ("titulo", ("title", "titulo", "job_title")),
+    ("empresa", ("company", "empresa", "company_name")),
+    ("descricao", ("description", "descricao", "job_description")),
+    # date fields may be named differently
+    ("data_de_publicacao", ("date", "date_published", "published_at", "data")),
+    ("salario", ("salary", "salario")),
+    ("localizacao", ("location", "localidade", "city")),
+)
+CSV_HEADERS = [col for col, _ in _CSV_KEYGROUPS]
+
+
+def _normalize_job_tuple(job: Dict[str, Any]) -> tuple:
+    """Extract the CSV fields from a job dict safely, in CSV_HEADERS order.
 
     Fields: titulo, empresa, descricao, data de publicacao, salario, localizacao
     """
-    # Helpers to try multiple possible keys
-    def pick(obj: Dict[str, Any], *keys):
-        for k in keys:
-            v = obj.get(k)
-            if v:
-                return v
-        return ""
-
-    title = pick(job, "title", "titulo", "job_title")
-    company = pick(job, "company", "empresa", "company_name")
-    description = pick(job, "description", "descricao", "job_description")
-    # date fields may be named differently
-    pub_date = pick(job, "date", "date_published", "published_at", "data")
-    salary = pick(job, "salary", "salario")
-    location = pick(job, "location", "localidade", "city")
-
-    return {
-        "titulo": str(title),
-        "empresa": str(company),
-        "descricao": str(description),
-        "data_de_publicacao": str(pub_date),
-        "salario": str(salary),
-        "localizacao": str(location),
-    }
+    get = job.get
+    return tuple(str(next((v for k in keys if (v := get(k))), "")) for _, keys in _CSV_KEYGROUPS)
 
 
 def _export_to_csv(jobs: List[Dict[str, Any]], path: str) -> None:
-    """Write a list of job dicts to CSV at `path` using normalized fields."""
-    if not jobs:
-        # create empty file with headers
-        headers = ["titulo", "empresa", "descricao", "data_de_publicacao", "salario", "localizacao"]
-        with open(path, "w", newline="", encoding="utf-8") as fh:
-            writer = csv.DictWriter(fh, fieldnames=headers)
-            writer.writeheader()
-        return
+    """Write a list of job dicts to CSV at `path` using normalized fields.
 
-    rows = [_normalize_job_for_csv(j) for j in jobs]
-    headers = list(rows[0].keys())
-    with open(path, "w", newline="", encoding="utf-8") as fh:
-        writer = csv.DictWriter(fh, fieldnames=headers)
-        writer.writeheader()
-        writer.writerows(rows)
+    Rows are normalized lazily and streamed into the writer, so memory stays
+    flat regardless of how many jobs are exported.
+    """
+    with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as fh:
+        writer = csv.writer(fh)
+        writer.writerow(CSV_HEADERS)
+        writer.writerows(_normalize_job_tuple(j) for j in jobs)
 
 
 
 @app.command("type")
-def work_type(job_id: str = typer.Argument(..., help="Job ID (required)")):
-    """Extract work regime from a specific job.
+def work_type(job_ids: List[str] = typer.Argument(..., help="One or more job IDs (required)")):
+    """Extract work regime from one or more jobs.
     
-    CLI usage: `python jobscli.py type 12345`
+    CLI usage: `python jobscli.py type 12345` or `python jobscli.py type 12345 67890`
     """
     try:
-        resp = get_job(job_id)
-        data = resp.json()
-        regime = extract_work_regime(data)
-        typer.echo(regime)
+        if len(job_ids) == 1:
+            data = _loads(get_job(job_ids[0]).content)
+            typer.echo(extract_work_regime(data))
+        else:
+            for job_id, data in zip(job_ids, get_jobs(job_ids)):
+                typer.echo(f"{job_id}: {extract_work_regime(data)}")
     except Exception as e:
         typer.echo(f"Error fetching job: {e}", err=True)
         raise typer.Exit(code=1)
@@ -286,13 +485,13 @@ def list_company(
         }
         # Use company as query to increase chance of relevant results
         resp = search_jobs(company, limit=limit, extra_params=extra)
-        data = resp.json()
+        data = _loads(resp.content)
         jobs = _extract_jobs_from_response(data)
     except Exception as e:
         typer.echo(f"Error fetching jobs: {e}", err=True)
         raise typer.Exit(code=1)
 
-    typer.echo(json.dumps(jobs, indent=2, ensure_ascii=False))
+    _echo_json(jobs)
 
     if csv_path:
         try:
@@ -314,21 +513,6 @@ def skills(
 
     Example: `python jobscli.py skills 2025-01-01 2025-06-30 --limit 1000`
     """
-    # default skill list; you can extend as needed
-    skills_list = [
-        "python",
-        "java",
-        "javascript",
-        "c#",
-        "php",
-        "sql",
-        "aws",
-        "docker",
-        "kubernetes",
-        "react",
-        "angular",
-    ]
-
     try:
         s_date = date.fromisoformat(start_date)
         e_date = date.fromisoformat(end_date)
@@ -336,49 +520,32 @@ def skills(
         typer.echo(f"Invalid date format: {e}", err=True)
         raise typer.Exit(code=1)
 
+    # filter by publication date as pages stream in
+    matched_jobs = []
+    counts: Counter = Counter({k: 0 for k in SKILLS_LIST})
+
     try:
-        resp = list_jobs(limit)
-        data = resp.json()
-        jobs = _extract_jobs_from_response(data)
+        for job in iter_jobs_paged(limit, since=s_date):
+            jd = _job_date(job)
+            if jd is None or not (s_date <= jd <= e_date):
+                continue
+
+            # job falls in date range; count skills
+            title = job.get("title") or ""
+            desc = job.get("description") or ""
+            content = f"{title} {desc}".lower()
+            hits = _SKILLS_ALT.findall(content)
+            if hits:
+                counts.update(hits)
+                matched_jobs.append(job)
     except Exception as e:
         typer.echo(f"Error fetching jobs: {e}", err=True)
         raise typer.Exit(code=1)
 
-    # filter by publication date (try to find YYYY-MM-DD in job data)
-    matched_jobs = []
-    counts: Dict[str, int] = {k: 0 for k in skills_list}
-
-    date_re = re.compile(r"(\d{4}-\d{2}-\d{2})")
-    for job in jobs:
-        text = json.dumps(job).lower()
-        m = date_re.search(text)
-        if not m:
-            continue
-        try:
-            jd = date.fromisoformat(m.group(1))
-        except Exception:
-            continue
-
-        if not (s_date <= jd <= e_date):
-            continue
-
-        # job falls in date range; count skills
-        content = (str(job.get("title", "")) + " " + str(job.get("description", ""))).lower()
-        found = False
-        for skill in skills_list:
-            # word boundary matching
-            matches = re.findall(r"\b" + re.escape(skill) + r"\b", content)
-            if matches:
-                counts[skill] += len(matches)
-                found = True
-
-        if found:
-            matched_jobs.append(job)
-
     # sort counts descending and produce a single dict inside a list as requested
     ordered = dict(sorted({k: v for k, v in counts.items() if v > 0}.items(), key=lambda x: x[1], reverse=True))
 
-    typer.echo(json.dumps([ordered], indent=2, ensure_ascii=False))
+    _echo_json([ordered])
 
     if csv_path:
         try:
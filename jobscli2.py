@@ -3,11 +3,37 @@ from typing import Dict, Any, Optional, List
 import requests
 import typer
 import json
+import sys
+import os
+import tempfile
+import time
+import hashlib
 import re
 import csv
+import io
 from datetime import date
 import unicodedata
+from collections import Counter
+from functools import lru_cache
 from html import unescape
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # opcional: sem orjson usa-se o módulo json da stdlib
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # opcional: sem selectolax usa-se a conversão por regex
+    LexborHTMLParser = None
+
+try:
+    import ahocorasick
+except ImportError:  # opcional: sem pyahocorasick usam-se as regex do regime
+    ahocorasick = None
 
 # CONFIGURAÇÃO
 
@@ -24,54 +50,149 @@ API_CONFIG: Dict[str, Any] = {
     }
 }
 
+# calculados uma vez no import em vez de em cada pedido
+_ITJOBS_API_KEY: str = API_CONFIG["api"]["key"]
+_URL_GET = urljoin(API_CONFIG["api"]["base_url"], API_CONFIG["api"]["endpoints"]["get"])
+_URL_LIST = urljoin(API_CONFIG["api"]["base_url"], API_CONFIG["api"]["endpoints"]["list"])
+_URL_SEARCH = urljoin(API_CONFIG["api"]["base_url"], API_CONFIG["api"]["endpoints"]["search"])
+
+_ITJOBS_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:115.0) Gecko/20100101 Firefox/115.0",
+}
 TEAMLYZER_UA = {"User-Agent": "Mozilla/5.0 (compatible; TeamlyzerScraper/1.0)"}
 TEAMLYZER_BASE = "https://pt.teamlyzer.com"
+# só se lê o início de cada página do Teamlyzer: rating, salário, benefícios e links
+# de empresas aparecem bem antes deste limite
+TEAMLYZER_MAX_BYTES = 256 * 1024
+
+# cache em disco das páginas do Teamlyzer, partilhada entre execuções (--no-cache ignora-a)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "jobscli", "teamlyzer")
+TEAMLYZER_CACHE_TTL = 3600
+_CACHE_ENABLED = True
+
+# nº de pedidos get.json em simultâneo no comando statistics (cabe no pool da sessão)
+STATISTICS_WORKERS = 10
+
+# PADRÕES (compilados uma vez no import)
+
+_RE_WS = re.compile(r"\s+")
+# scripts/styles, <br> e </p> (grupo 1, viram quebra de linha) e restantes tags, numa só alternância
+_RE_HTML = re.compile(r"<script.*?>.*?</script>|<style.*?>.*?</style>|(<br\s*/?>|</p\s*>)|<[^>]+>", re.I | re.S)
+_RE_HSPACE = re.compile(r"[ \t\r\f\v]+")
+_RE_BLANKLINES = re.compile(r"\n\s*\n+")
+_RE_SLUG_CLEAN = re.compile(r"[^a-z0-9\-]+")
+_RE_COMPANY_LINK = re.compile(r'href="/companies/([a-z0-9\-]+)"', re.I)
+_RE_RATING = re.compile(r"(\d(?:\.\d)?)\s*/\s*5")
+_RE_DESC_SKIP = re.compile(r"/5|Reviews|Visão geral|Emprego|Entrevista|Salário|Seguir")
+_RE_SALARY = re.compile(r"sal[aá]rio m[eé]dio.*?entre\s+os\s+([^\.]+?)\s+e\s+([^\.]+?)\.", re.I)
+# bloco de benefícios: da linha a seguir a "Benefícios e vantagens" até à linha com "Valores e cultura"
+_RE_BENEFITS_BLOCK = re.compile(r"Benef[ií]cios e vantagens[^\n]*\n(.*?)(?:^[^\n]*Valores e cultura|\Z)", re.I | re.S | re.M)
+_RE_BENEFIT_BULLET = re.compile(r"^[^\S\n]*\* (.*)$", re.M)
+_RE_REGIME_REMOTE = re.compile(r"\bremoto\b|\bremote\b")
+_RE_REGIME_HYBRID = re.compile(r"\bh[íi]brido\b|\bhybrid\b")
+_RE_REGIME_ONSITE = re.compile(r"\bpresencial\b|\bon-?site\b|\bfísico\b")
+
+# palavras-chave do regime de trabalho, por ordem de prioridade do rótulo
+_REGIME_KEYWORDS = (
+    ("remoto", "remote"),
+    ("remote", "remote"),
+    ("hibrido", "hybrid"),
+    ("híbrido", "hybrid"),
+    ("hybrid", "hybrid"),
+    ("presencial", "on-site"),
+    ("onsite", "on-site"),
+    ("on-site", "on-site"),
+    ("físico", "on-site"),
+)
+_REGIME_ORDER = ("remote", "hybrid", "on-site")
+
+if ahocorasick is not None:
+    # autómato construído uma vez: um só varrimento do texto para todas as palavras
+    _REGIME_AC = ahocorasick.Automaton()
+    for _kw, _label in _REGIME_KEYWORDS:
+        _REGIME_AC.add_word(_kw, (len(_kw), _label))
+    _REGIME_AC.make_automaton()
+else:
+    _REGIME_AC = None
+
+# Lista de skills por omissão (podes estender)
+_SKILLS_LIST = (
+    "python",
+    "java",
+    "javascript",
+    "c#",
+    "php",
+    "sql",
+    "aws",
+    "docker",
+    "kubernetes",
+    "react",
+    "angular",
+)
+# uma só alternância: cada texto é percorrido uma vez para todas as skills;
+# o texto já chega em minúsculas, e o \b Unicode trata letras acentuadas como parte da palavra
+_SKILLS_RE = re.compile(r"\b(" + "|".join(re.escape(s) for s in _SKILLS_LIST) + r")\b")
+
+# slugs que aparecem em /companies/ mas não são empresas
+_NON_COMPANY_SLUGS = {"ranking", "awards", "jobs", "remote-companies"}
+
+# chaves onde as APIs costumam pôr cada campo (por ordem de preferência)
+_COMPANY_KEYS = ("company", "empresa", "company_name", "companyName", "empresa_nome")
+_NAME_SUBKEYS = ("name", "title", "nome")
+# num dict de empresa procura-se "nome" antes de "title" (ordem original da extração da empresa)
+_COMPANY_SUBKEYS = ("name", "nome", "title")
+_ZONE_KEYS = ("location", "localizacao", "localidade", "city", "region", "zona")
+_TYPE_KEYS = ("type", "tipo", "employment_type", "contract_type", "contract")
+_CSV_FIELD_KEYS = (
+    ("titulo", ("title", "titulo", "job_title")),
+    ("empresa", ("company", "empresa", "company_name")),
+    ("descricao", ("description", "descricao", "job_description")),
+    ("data_de_publicacao", ("date", "date_published", "published_at", "data")),
+    ("salario", ("salary", "salario")),
+    ("localizacao", ("location", "localidade", "city")),
+)
+_CSV_HEADERS = tuple(column for column, _ in _CSV_FIELD_KEYS)
 
 # A app Typer tem de existir antes dos decorators @app.command(...)
 app = typer.Typer()
 
-# HELPERS (API ITJOBS)
-
-def _get_api_key() -> str:
-    return API_CONFIG["api"].get("key", "")
-
 
-def _build_url(name: str) -> str:
-    api = API_CONFIG["api"]
-    endpoints = api.get("endpoints", {})
-    if name not in endpoints:
-        raise KeyError(f"Endpoint desconhecido: {name}")
+@app.callback()
+def main(
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignora a cache local das páginas do Teamlyzer"),
+):
+    """Consulta o itjobs.pt (enriquecido com dados do Teamlyzer) a partir da linha de comandos."""
+    global _CACHE_ENABLED
+    _CACHE_ENABLED = not no_cache
 
-    path = endpoints[name]
-    return urljoin(api["base_url"], path)
+# HELPERS (API ITJOBS)
 
+def _build_session(headers: Dict[str, str]) -> requests.Session:
+    """Cria uma sessão com keep-alive, pool de ligações e retries, partilhada por todos os pedidos a um host.
 
-def _get_headers() -> Dict[str, str]:
-    headers: Dict[str, str] = {}
-    headers.setdefault(
-        "User-Agent",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:115.0) Gecko/20100101 Firefox/115.0",
+    As falhas transitórias (429/5xx, ligação) são repetidas aqui, com backoff exponencial,
+    por isso quem chama só precisa de tratar `requests.RequestException`.
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
     )
-    return headers
+    # cada sessão fala com um único host: um pool, com uma ligação por worker em paralelo
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=STATISTICS_WORKERS, max_retries=retries)
+    session.mount("https://", adapter)
+    session.headers.update(headers)
+    return session
 
 
-def _get_params(extra_params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    params: Dict[str, Any] = {}
-    api_key = _get_api_key()
-    if api_key:
-        params.setdefault("api_key", api_key)
-    if extra_params:
-        params.update(extra_params)
-    return params
+_ITJOBS_SESSION = _build_session(_ITJOBS_HEADERS)
+_TEAMLYZER_SESSION = _build_session(TEAMLYZER_UA)
 
 
 def list_jobs(limit: int):
-    params = _get_params({"limit": limit})
-    headers = _get_headers()
-
-    url = _build_url("list")
-
-    resp = requests.get(url, params=params, headers=headers)
+    resp = _ITJOBS_SESSION.get(_URL_LIST, params={"api_key": _ITJOBS_API_KEY, "limit": limit}, timeout=20)
 
     resp.raise_for_status()
 
@@ -80,14 +201,8 @@ def list_jobs(limit: int):
 
 def search_jobs(q: str, limit: int, extra_params: Optional[Dict[str, Any]] = None):
     """Chama o endpoint `search` com a query `q` e devolve um `requests.Response`."""
-    params = _get_params(extra_params)
-    params["limit"] = limit
-    params["q"] = q
-
-    headers = _get_headers()
-
-    url = _build_url("search")
-    resp = requests.get(url, params=params, headers=headers)
+    params = {"api_key": _ITJOBS_API_KEY, **(extra_params or {}), "limit": limit, "q": q}
+    resp = _ITJOBS_SESSION.get(_URL_SEARCH, params=params, timeout=20)
     resp.raise_for_status()
 
     return resp
@@ -95,151 +210,283 @@ def search_jobs(q: str, limit: int, extra_params: Optional[Dict[str, Any]] = Non
 
 def get_job(job_id: str):
     """Chama o endpoint `get` para obter detalhes de uma vaga pelo ID."""
-    params = _get_params({"id": job_id})
-    headers = _get_headers()
-
-    url = _build_url("get")
-    resp = requests.get(url, params=params, headers=headers)
+    resp = _ITJOBS_SESSION.get(_URL_GET, params={"api_key": _ITJOBS_API_KEY, "id": job_id}, timeout=20)
     resp.raise_for_status()
 
     return resp
 
+# HELPERS (JSON)
+
+def _loads(raw: bytes) -> Any:
+    """Interpreta o corpo JSON de uma resposta (com orjson, se estiver instalado)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _echo_json(data: Any) -> None:
+    """Escreve `data` em JSON indentado no stdout.
+
+    Com orjson os bytes UTF-8 vão diretos para o stream binário, sem a str intermédia
+    que o typer.echo voltaria a codificar; sem orjson, o json.dump escreve por partes,
+    sem montar o documento inteiro em memória.
+    """
+    if orjson is None or not hasattr(sys.stdout, "buffer"):
+        json.dump(data, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+        return
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
+
 # HELPERS (TEAMLYZER / NORMALIZAÇÃO / HTML)
 
+@lru_cache(maxsize=4096)
 def _norm(s: str) -> str:
     """Normaliza string para matching mais flexível (minúsculas, sem acentos, trims, espaços)."""
     s = (s or "").strip().lower()
-    s = unicodedata.normalize("NFKD", s)
-    s = "".join(ch for ch in s if not unicodedata.combining(ch))
-    s = re.sub(r"\s+", " ", s)
+    # ASCII já está normalizado: evita a decomposição NFKD
+    if not s.isascii():
+        s = unicodedata.normalize("NFKD", s)
+        # remover os acentos (e restantes não-ASCII) no codec, em C, em vez de char a char
+        s = s.encode("ascii", "ignore").decode("ascii")
+    s = _RE_WS.sub(" ", s)
     return s
 
 
+# acentos latinos mais comuns -> ASCII (depois de lower()), aplicados por str.translate
+_DIACRITIC_MAP = str.maketrans({
+    "á": "a", "à": "a", "â": "a", "ã": "a", "ä": "a", "å": "a",
+    "é": "e", "è": "e", "ê": "e", "ë": "e",
+    "í": "i", "ì": "i", "î": "i", "ï": "i",
+    "ó": "o", "ò": "o", "ô": "o", "õ": "o", "ö": "o",
+    "ú": "u", "ù": "u", "û": "u", "ü": "u",
+    "ç": "c", "ñ": "n", "ý": "y", "ÿ": "y",
+})
+
+
+def _norm_fast(s: str) -> str:
+    """Igual a `_norm`, mas pensada para textos grandes (páginas) e sem cache.
+
+    Os acentos latinos comuns são dobrados por tabela; só se ainda sobrar algum carácter
+    não-ASCII (’, ™, ø, –, ...) é que se faz a decomposição NFKD, como em `_norm`, para
+    que os dois lados de uma comparação fiquem normalizados da mesma forma.
+    """
+    s = (s or "").strip().lower().translate(_DIACRITIC_MAP)
+    if not s.isascii():
+        s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
+    return _RE_WS.sub(" ", s)
+
+
+def _unique_by_norm(items: List[str]) -> List[str]:
+    """Remove duplicados (comparando com `_norm`), mantendo a primeira ocorrência e a ordem."""
+    first: Dict[str, str] = {}
+    for item in items:
+        first.setdefault(_norm(item), item)
+    first.pop("", None)
+    return list(first.values())
+
+
+def _html_tag_replacement(m: re.Match) -> str:
+    return "\n" if m.group(1) else " "
+
+
 def _html_to_text(html: str) -> str:
-    """Conversão muito simples de HTML -> texto."""
+    """Conversão muito simples de HTML -> texto.
+
+    Com selectolax instalado o HTML é interpretado numa só passagem em C;
+    caso contrário usa-se uma única passagem de regex. As linhas resultantes
+    são equivalentes (a menos de espaços) nos dois caminhos.
+    """
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html or "")
+        tree.strip_tags(["script", "style"])
+        root = tree.body or tree.root
+        if root is None:
+            return ""
+        # <br> e </p> passam a quebras de linha, como na versão por regex
+        for node in root.css("br, p"):
+            node.insert_after("\n")
+        text = root.text(separator=" ", strip=False)
+        text = _RE_HSPACE.sub(" ", text)
+        text = _RE_BLANKLINES.sub("\n", text)
+        return text.strip()
+
     html = unescape(html or "")
-    # remover scripts/styles
-    html = re.sub(r"(?is)<script.*?>.*?</script>", " ", html)
-    html = re.sub(r"(?is)<style.*?>.*?</style>", " ", html)
-    # substituir <br> e </p> por quebras de linha
-    html = re.sub(r"(?i)<br\s*/?>", "\n", html)
-    html = re.sub(r"(?i)</p\s*>", "\n", html)
-    # remover tags
-    text = re.sub(r"(?s)<[^>]+>", " ", html)
+    # remover scripts/styles e tags; <br> e </p> passam a quebras de linha
+    text = _RE_HTML.sub(_html_tag_replacement, html)
     # normalizar espaços
-    text = re.sub(r"[ \t\r\f\v]+", " ", text)
-    text = re.sub(r"\n\s*\n+", "\n", text)
+    text = _RE_HSPACE.sub(" ", text)
+    text = _RE_BLANKLINES.sub("\n", text)
     return text.strip()
 
 
+def _first_str(obj: Dict[str, Any], keys: tuple) -> str:
+    """Devolve a primeira string não vazia (sem espaços nas pontas) entre `keys`, ou ""."""
+    get = obj.get
+    for k in keys:
+        v = get(k)
+        if type(v) is str:
+            v = v.strip()
+            if v:
+                return v
+    return ""
+
+
+def _pick_job_field(job: Dict[str, Any], *keys: str, subkeys: tuple = _NAME_SUBKEYS) -> str:
+    """Tenta várias chaves e devolve a primeira string não vazia (ou o nome, se o valor for um dict)."""
+    get = job.get
+    for k in keys:
+        v = get(k)
+        if type(v) is str:
+            v = v.strip()
+            if v:
+                return v
+        elif type(v) is dict:
+            v = _first_str(v, subkeys)
+            if v:
+                return v
+    return ""
+
+
 def _extract_company_name(job_json: Dict[str, Any]) -> str:
     """Tenta (de forma robusta) extrair o nome da empresa do payload de uma vaga do itjobs."""
     if not isinstance(job_json, dict):
         return ""
-    # padrões comuns em APIs
-    for key in ("company", "empresa"):
-        val = job_json.get(key)
-        if isinstance(val, str) and val.strip():
-            return val.strip()
-        if isinstance(val, dict):
-            for k2 in ("name", "nome", "title"):
-                v2 = val.get(k2)
-                if isinstance(v2, str) and v2.strip():
-                    return v2.strip()
-
-    # fallback: algumas APIs usam "company_name"
-    for key in ("company_name", "companyName", "empresa_nome"):
-        v = job_json.get(key)
-        if isinstance(v, str) and v.strip():
-            return v.strip()
+    # padrões comuns em APIs ("company", "empresa"; fallback "company_name" e afins)
+    return _pick_job_field(job_json, *_COMPANY_KEYS, subkeys=_COMPANY_SUBKEYS)
 
-    return ""
+
+def _fetch_teamlyzer_page(url: str) -> Optional[str]:
+    """HTML de uma página do Teamlyzer, ou None se estiver indisponível (já depois dos retries da sessão).
+
+    A resposta é lida em stream e cortada em `TEAMLYZER_MAX_BYTES`. As páginas obtidas ficam
+    em disco durante `TEAMLYZER_CACHE_TTL` segundos; `--no-cache` ignora a leitura e a escrita.
+    """
+    path = os.path.join(CACHE_DIR, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".html")
+    if _CACHE_ENABLED:
+        try:
+            if time.time() - os.path.getmtime(path) < TEAMLYZER_CACHE_TTL:
+                with open(path, "r", encoding="utf-8") as fh:
+                    return fh.read()
+        except OSError:
+            pass
+
+    try:
+        with _TEAMLYZER_SESSION.get(url, timeout=20, stream=True) as r:
+            r.raise_for_status()
+            chunks = []
+            size = 0
+            for chunk in r.iter_content(chunk_size=64 * 1024):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= TEAMLYZER_MAX_BYTES:
+                    break
+            encoding = r.encoding or "utf-8"
+    except requests.RequestException:
+        return None
+    body = b"".join(chunks)[:TEAMLYZER_MAX_BYTES]
+    try:
+        html = body.decode(encoding, errors="replace")
+    except LookupError:
+        # charset desconhecido no Content-Type: usar utf-8 em vez de rebentar
+        html = body.decode("utf-8", errors="replace")
+
+    if _CACHE_ENABLED:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # nome único por escrita: as páginas da empresa são pedidas em threads paralelas
+            fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(html)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    return html
+
+
+def _teamlyzer_page_exists(url: str) -> bool:
+    """True se a página do Teamlyzer responder 2xx a um HEAD (sem seguir redirecionamentos)."""
+    try:
+        r = _TEAMLYZER_SESSION.head(url, timeout=10, allow_redirects=False)
+    except requests.RequestException:
+        return False
+    return 200 <= r.status_code < 300
 
 
 def _find_teamlyzer_company_slug(company_name: str, max_pages_fallback: int = 3) -> Optional[str]:
     """
     Procura o slug da empresa no Teamlyzer.
+    0) Confirma com um HEAD se o slug adivinhado a partir do nome existe
     1) Tenta /companies/ranking (Top 50)
     2) Fallback: tenta /companies/ (primeiras N páginas)
     Devolve slug como "blip" ou "pwc".
     """
-    target = _norm(company_name)
+    return _find_slug_cached(_norm(company_name), max_pages_fallback)
+
+
+@lru_cache(maxsize=1024)
+def _find_slug_cached(target: str, max_pages_fallback: int) -> Optional[str]:
+    """Corpo de `_find_teamlyzer_company_slug`, memorizado pelo nome já normalizado."""
     if not target:
         return None
 
-    # helper: extrair pares (slug, display_name) do HTML
-    def extract_pairs(html: str) -> List[tuple]:
-        pairs = []
-        # links de perfil costumam ser /companies/<slug>
-        for m in re.finditer(r'href="(/companies/([a-z0-9\-]+))"', html, flags=re.I):
-            slug = m.group(2)
-            # evitar páginas óbvias que não são empresas
-            if slug in {"ranking", "awards", "jobs", "remote-companies"}:
-                continue
-            pairs.append((slug, slug))
-        # remover duplicados mantendo ordem
-        seen = set()
-        out = []
-        for slug, name in pairs:
-            if slug not in seen:
-                seen.add(slug)
-                out.append((slug, name))
-        return out
+    # helper: extrair slugs do HTML (links de perfil costumam ser /companies/<slug>),
+    # sem páginas óbvias que não são empresas e sem duplicados, mantendo a ordem
+    def extract_slugs(html: str) -> List[str]:
+        return list(dict.fromkeys(s for s in _RE_COMPANY_LINK.findall(html) if s not in _NON_COMPANY_SLUGS))
+
+    # nome em forma de slug, calculado uma vez para todas as páginas
+    target_slug = target.replace(" ", "-")
+    # heurística leve: "Blip.pt" -> "blip" (remover pontuação)
+    guess = _RE_SLUG_CLEAN.sub("", target_slug)
+
+    def match_page(html: str) -> Optional[str]:
+        # caminho rápido: um único findall dá todos os slugs e o palpite é um teste O(1),
+        # sem converter a página para texto nem normalizá-la
+        slugs = extract_slugs(html)
+        if guess and guess in {slug.lower() for slug in slugs}:
+            return guess
+
+        # caminho lento: só se o nome aparecer na página é que se tentam as heurísticas;
+        # para um teste de "contém" basta tirar as tags numa passagem, sem converter a página para texto
+        if target not in _norm_fast(unescape(_RE_HTML.sub(" ", html))):
+            return None
+
+        # tentar slug que apareça no nome normalizado
+        for slug in slugs:
+            if slug and slug in target_slug:
+                return slug
+        return None
 
-    # 1) ranking
-    try:
-        r = requests.get(f"{TEAMLYZER_BASE}/companies/ranking", headers=TEAMLYZER_UA, timeout=20)
-        r.raise_for_status()
-        html = r.text
-        # a página de ranking tem nomes visíveis; fazemos texto simples e comparamos
-        text = _html_to_text(html)
-        # brute: se o nome aparece, tentar achar slug por heurística
-        if target in _norm(text):
-            for slug, _ in extract_pairs(html):
-                if slug and slug in _norm(company_name).replace(" ", "-"):
-                    return slug
-        # heurística leve: "Blip.pt" -> "blip" (remover pontuação)
-        guess = re.sub(r"[^a-z0-9\-]+", "", _norm(company_name).replace(" ", "-"))
-        if guess:
-            if re.search(rf'href="/companies/{re.escape(guess)}"', html, flags=re.I):
-                return guess
-    except Exception:
-        pass
-
-    # 2) fallback: varrer primeiras N páginas de /companies/
+    # 0) caminho mais comum: o palpite é o slug; um HEAD confirma-o sem descarregar listagens
+    if guess and guess not in _NON_COMPANY_SLUGS and _teamlyzer_page_exists(f"{TEAMLYZER_BASE}/companies/{guess}"):
+        return guess
+
+    # 1) ranking, 2) fallback: varrer primeiras N páginas de /companies/
+    urls = [f"{TEAMLYZER_BASE}/companies/ranking"]
     for page in range(1, max_pages_fallback + 1):
-        try:
-            url = f"{TEAMLYZER_BASE}/companies/"
-            if page != 1:
-                url = f"{TEAMLYZER_BASE}/companies/?page={page}"
-            r = requests.get(url, headers=TEAMLYZER_UA, timeout=20)
-            r.raise_for_status()
-            html = r.text
-            text = _html_to_text(html)
-
-            if target in _norm(text):
-                guess = re.sub(r"[^a-z0-9\-]+", "", _norm(company_name).replace(" ", "-"))
-                if guess and re.search(rf'href="/companies/{re.escape(guess)}"', html, flags=re.I):
-                    return guess
-
-                # tentar slug que apareça no nome normalizado
-                for slug, _ in extract_pairs(html):
-                    if slug and slug in _norm(company_name).replace(" ", "-"):
-                        return slug
-
-                # último recurso: procurar slug “perto” do nome (heurística fraca)
-                for slug, _ in extract_pairs(html):
-                    if slug and re.search(rf"\b{re.escape(slug)}\b", _norm(company_name).replace(" ", "-")):
-                        return slug
-        except Exception:
+        urls.append(f"{TEAMLYZER_BASE}/companies/" if page == 1 else f"{TEAMLYZER_BASE}/companies/?page={page}")
+
+    for url in urls:
+        html = _fetch_teamlyzer_page(url)
+        if html is None:
+            # página indisponível (já depois dos retries): tentar a seguinte
             continue
+        slug = match_page(html)
+        if slug:
+            return slug
 
     return None
 
 
+@lru_cache(maxsize=512)
 def _scrape_teamlyzer_company(slug: str, top_benefits: int = 5) -> Dict[str, Any]:
     """
     Faz scraping do rating, descrição, salário e benefícios a partir das páginas da empresa no Teamlyzer.
+    O resultado fica em cache durante a execução (partilhado entre chamadas; não o alterar).
     """
     out: Dict[str, Any] = {
         "teamlyzer_rating": None,
@@ -251,83 +498,59 @@ def _scrape_teamlyzer_company(slug: str, top_benefits: int = 5) -> Dict[str, Any
     if not slug:
         return out
 
+    # as duas páginas da empresa (principal e benefícios) são pedidas em paralelo
+    urls = (
+        f"{TEAMLYZER_BASE}/companies/{slug}",
+        f"{TEAMLYZER_BASE}/companies/{slug}/benefits-and-values",
+    )
+    with ThreadPoolExecutor(max_workers=len(urls)) as ex:
+        overview_html, benefits_html = ex.map(_fetch_teamlyzer_page, urls)
+
     # página principal da empresa
-    try:
-        r = requests.get(f"{TEAMLYZER_BASE}/companies/{slug}", headers=TEAMLYZER_UA, timeout=20)
-        r.raise_for_status()
-        text = _html_to_text(r.text)
+    if overview_html is not None:
+        text = _html_to_text(overview_html)
 
         # rating: primeiro match do tipo 3.4/5
-        m = re.search(r"(\d(?:\.\d)?)\s*/\s*5", text)
+        m = _RE_RATING.search(text)
         if m:
             try:
                 out["teamlyzer_rating"] = float(m.group(1))
-            except Exception:
+            except ValueError:
                 out["teamlyzer_rating"] = m.group(1)
 
         # descrição: heurística simples (primeira linha “grande” no topo que não seja menu/metadata)
         lines = [ln.strip() for ln in text.split("\n") if ln.strip()]
         desc = None
         for ln in lines[:40]:
-            if len(ln) >= 60 and not re.search(r"/5|Reviews|Visão geral|Emprego|Entrevista|Salário|Seguir", ln):
+            if len(ln) >= 60 and not _RE_DESC_SKIP.search(ln):
                 desc = ln
                 break
         if desc:
             out["teamlyzer_description"] = desc
 
         # salário: tentar apanhar "salário médio ... entre os X€ e Y€."
-        ms = re.search(
-            r"sal[aá]rio m[eé]dio.*?entre\s+os\s+([^\.]+?)\s+e\s+([^\.]+?)\.",
-            text,
-            flags=re.I
-        )
+        ms = _RE_SALARY.search(text)
         if ms:
             out["teamlyzer_salary"] = f"entre {ms.group(1).strip()} e {ms.group(2).strip()}"
-    except Exception:
-        pass
 
     # página de benefícios (benefits-and-values)
-    try:
-        r = requests.get(
-            f"{TEAMLYZER_BASE}/companies/{slug}/benefits-and-values",
-            headers=TEAMLYZER_UA,
-            timeout=20
-        )
-        r.raise_for_status()
-        text = _html_to_text(r.text)
+    if benefits_html is not None:
+        text = _html_to_text(benefits_html)
 
-        # extrair linhas tipo bullet sob "Benefícios e vantagens"
+        # extrair linhas tipo bullet sob "Benefícios e vantagens" (um search para o bloco, um findall para os bullets)
         benefits = []
-        in_benefits = False
-        for ln in text.split("\n"):
-            s = ln.strip()
-            if re.search(r"Benef[ií]cios e vantagens", s, flags=re.I):
-                in_benefits = True
-                continue
-            if in_benefits and re.search(r"Valores e cultura", s, flags=re.I):
-                break
-            if in_benefits and s.startswith("* "):
-                title = s[2:].strip()
-                if len(title) >= 3:
-                    benefits.append(title)
+        mb = _RE_BENEFITS_BLOCK.search(text)
+        if mb:
+            benefits = [t for t in (b.strip() for b in _RE_BENEFIT_BULLET.findall(mb.group(1))) if len(t) >= 3]
 
         # manter únicos, top N
-        seen = set()
-        uniq = []
-        for b in benefits:
-            nb = _norm(b)
-            if nb and nb not in seen:
-                seen.add(nb)
-                uniq.append(b)
-        out["teamlyzer_benefits"] = uniq[:top_benefits]
-    except Exception:
-        pass
+        out["teamlyzer_benefits"] = _unique_by_norm(benefits)[:top_benefits]
 
     return out
 
 
 def enrich_job_with_teamlyzer(job_json: Dict[str, Any], fallback_pages: int = 3) -> Dict[str, Any]:
-    """Devolve uma cópia de job_json enriquecida com campos do Teamlyzer."""
+    """Enriquece job_json com campos do Teamlyzer (no próprio dict, sem cópia) e devolve-o."""
     if not isinstance(job_json, dict):
         return {"data": job_json}
 
@@ -335,109 +558,120 @@ def enrich_job_with_teamlyzer(job_json: Dict[str, Any], fallback_pages: int = 3)
     slug = _find_teamlyzer_company_slug(company_name, max_pages_fallback=fallback_pages) if company_name else None
     info = _scrape_teamlyzer_company(slug or "", top_benefits=5)
 
-    enriched = dict(job_json)
-    enriched.update(info)
-    return enriched
+    job_json.update(info)
+    return job_json
 
 # HELPERS (EXTRAÇÃO / CSV / LÓGICA)
 
 def top_jobs(limit: int) -> list:
     resp = list_jobs(limit)
-    data = resp.json()
+    data = _loads(resp.content)
     jobs = _extract_jobs_from_response(data)
     return jobs
 
 
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _regime_from_automaton(text: str) -> str:
+    """Procura as palavras-chave do regime num só varrimento (equivalente às regex com \\b)."""
+    found = set()
+    last = len(text) - 1
+    for end, (size, label) in _REGIME_AC.iter(text):
+        start = end - size + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < last and _is_word_char(text[end + 1]):
+            continue
+        if label == "remote":
+            return label
+        found.add(label)
+
+    for label in _REGIME_ORDER:
+        if label in found:
+            return label
+    return "other"
+
+
 def extract_work_regime(job_data: Dict[str, Any]) -> str:
     """Extrai o regime de trabalho (remoto/híbrido/presencial/outro) a partir dos dados da vaga."""
-    text = json.dumps(job_data).lower()
-
-    if re.search(r"\bremoto\b|\bremote\b", text):
+    # caminho rápido: só os campos candidatos ("body" é onde o itjobs põe a descrição)
+    keys = ("title", "body", "description", "type", "tipo", "location", "locations", "company", "tags")
+    regime = _regime_from_text(" ".join(str(job_data.get(k, "")) for k in keys).lower())
+    if regime == "other":
+        # caminho lento: varrer o registo inteiro (wrappers, campos aninhados, ...);
+        # ensure_ascii=False para "híbrido" não virar "h\u00edbrido"
+        regime = _regime_from_text(json.dumps(job_data, ensure_ascii=False).lower())
+    return regime
+
+
+def _regime_from_text(text: str) -> str:
+    """Classifica um texto já em minúsculas como remote/hybrid/on-site/other."""
+    if _REGIME_AC is not None:
+        return _regime_from_automaton(text)
+
+    # um `in` (em C) descarta cada categoria antes de correr a regex com \b
+    if "remot" in text and _RE_REGIME_REMOTE.search(text):
         return "remote"
-    elif re.search(r"\bh[íi]brido\b|\bhybrid\b", text):
+    elif ("brido" in text or "hybrid" in text) and _RE_REGIME_HYBRID.search(text):
         return "hybrid"
-    elif re.search(r"\bpresencial\b|\bon-?site\b|\bfísico\b", text):
+    elif ("presencial" in text or "site" in text or "sico" in text) and _RE_REGIME_ONSITE.search(text):
         return "on-site"
     else:
         return "other"
 
 
 def _extract_jobs_from_response(data: Any) -> List[Dict[str, Any]]:
-    """Tenta encontrar e devolver a lista de vagas a partir da resposta da API."""
-    if isinstance(data, list):
+    """Tenta encontrar e devolver a lista de vagas a partir da resposta da API.
+
+    Só se consultam as chaves conhecidas ("results" é a da API do itjobs); sem nenhuma
+    delas devolve-se uma lista vazia.
+    """
+    if type(data) is list:
         return data
 
-    if isinstance(data, dict):
-        for key in ("jobs", "results", "data", "items"):
+    if type(data) is dict:
+        for key in ("results", "jobs", "data", "items"):
             val = data.get(key)
-            if isinstance(val, list):
-                return val
-
-        for val in data.values():
-            if isinstance(val, list):
+            if type(val) is list:
                 return val
 
     return []
 
 
-def _pick_job_field(job: Dict[str, Any], *keys: str) -> str:
-    """Tenta várias chaves e devolve a primeira string não vazia."""
-    for k in keys:
-        v = job.get(k)
-        if isinstance(v, str) and v.strip():
-            return v.strip()
-        if isinstance(v, dict):
-            for kk in ("name", "title", "nome"):
-                vv = v.get(kk)
-                if isinstance(vv, str) and vv.strip():
-                    return vv.strip()
-    return ""
-
-
-def _normalize_job_for_csv(job: Dict[str, Any]) -> Dict[str, Any]:
-    """Extrai campos para CSV de forma segura.
+def _normalize_job_tuple(job: Dict[str, Any]) -> tuple:
+    """Extrai campos para CSV de forma segura, pela ordem de `_CSV_HEADERS`.
 
     Campos: titulo, empresa, descricao, data_de_publicacao, salario, localizacao
     """
-    def pick(obj: Dict[str, Any], *keys):
+    get = job.get
+    row = []
+    for _, keys in _CSV_FIELD_KEYS:
+        value = ""
         for k in keys:
-            v = obj.get(k)
+            v = get(k)
             if v:
-                return v
-        return ""
-
-    title = pick(job, "title", "titulo", "job_title")
-    company = pick(job, "company", "empresa", "company_name")
-    description = pick(job, "description", "descricao", "job_description")
-    pub_date = pick(job, "date", "date_published", "published_at", "data")
-    salary = pick(job, "salary", "salario")
-    location = pick(job, "location", "localidade", "city")
-
-    return {
-        "titulo": str(title),
-        "empresa": str(company),
-        "descricao": str(description),
-        "data_de_publicacao": str(pub_date),
-        "salario": str(salary),
-        "localizacao": str(location),
-    }
+                value = v
+                break
+        row.append(str(value))
+    return tuple(row)
 
 
 def _export_to_csv(jobs: List[Dict[str, Any]], path: str) -> None:
-    """Escreve uma lista de vagas para CSV em `path` (campos normalizados)."""
-    if not jobs:
-        headers = ["titulo", "empresa", "descricao", "data_de_publicacao", "salario", "localizacao"]
-        with open(path, "w", newline="", encoding="utf-8") as fh:
-            writer = csv.DictWriter(fh, fieldnames=headers)
-            writer.writeheader()
-        return
+    """Escreve uma lista de vagas para CSV em `path` (campos normalizados).
+
+    O CSV é montado em memória e gravado no ficheiro com uma única escrita.
+    """
+    # csv.writer com tuplos já na ordem dos cabeçalhos: sem dicts por linha;
+    # cada linha é gerada e escrita de seguida, sem listas intermédias
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(_CSV_HEADERS)
+    writer.writerows(map(_normalize_job_tuple, jobs))
 
-    rows = [_normalize_job_for_csv(j) for j in jobs]
-    headers = list(rows[0].keys())
     with open(path, "w", newline="", encoding="utf-8") as fh:
-        writer = csv.DictWriter(fh, fieldnames=headers)
-        writer.writeheader()
-        writer.writerows(rows)
+        fh.write(buf.getvalue())
 
 
 def _export_single_job_enriched_to_csv(job: Dict[str, Any], path: str) -> None:
@@ -467,14 +701,17 @@ def _export_single_job_enriched_to_csv(job: Dict[str, Any], path: str) -> None:
         "teamlyzer_benefits": "; ".join(job.get("teamlyzer_benefits", []) or []),
     }
 
+    buf = io.StringIO()
+    writer = csv.DictWriter(
+        buf,
+        fieldnames=headers,
+        delimiter=";",
+    )
+    writer.writeheader()
+    writer.writerow(row)
+
     with open(path, "w", newline="", encoding="utf-8") as fh:
-        writer = csv.DictWriter(
-            fh,
-            fieldnames=headers,
-            delimiter=";",  
-        )
-        writer.writeheader()
-        writer.writerow(row)
+        fh.write(buf.getvalue())
 
 
 def _extract_zone_from_job(job: Dict[str, Any]) -> str:
@@ -482,38 +719,32 @@ def _extract_zone_from_job(job: Dict[str, Any]) -> str:
     locs = job.get("locations")
     if isinstance(locs, list) and locs:
         first = locs[0]
-        if isinstance(first, dict):
-            name = first.get("name") or first.get("title") or first.get("nome")
-            if isinstance(name, str) and name.strip():
-                return name.strip()
-        if isinstance(first, str) and first.strip():
+        if type(first) is dict:
+            name = _first_str(first, _NAME_SUBKEYS)
+            if name:
+                return name
+        elif type(first) is str and first.strip():
             return first.strip()
 
     # fallback: campos comuns
-    for k in ("location", "localizacao", "localidade", "city", "region", "zona"):
-        v = job.get(k)
-        if isinstance(v, str) and v.strip():
-            return v.strip()
-
-    return "Unknown"
+    return _first_str(job, _ZONE_KEYS) or "Unknown"
 
 
 def _extract_type_from_job(job: Dict[str, Any]) -> str:
     # No detalhe, o tipo pode vir em vários formatos
-    for k in ("type", "tipo", "employment_type", "contract_type", "contract"):
-        v = job.get(k)
-        if isinstance(v, str) and v.strip():
-            return v.strip()
+    v = _first_str(job, _TYPE_KEYS)
+    if v:
+        return v
 
     # Às vezes vem como lista (ex.: types)
     types = job.get("types")
     if isinstance(types, list) and types:
         t0 = types[0]
-        if isinstance(t0, dict):
-            name = t0.get("name") or t0.get("title")
-            if isinstance(name, str) and name.strip():
-                return name.strip()
-        if isinstance(t0, str) and t0.strip():
+        if type(t0) is dict:
+            name = _first_str(t0, ("name", "title"))
+            if name:
+                return name
+        elif type(t0) is str and t0.strip():
             return t0.strip()
 
     return "Unknown"
@@ -535,7 +766,7 @@ def top(
         typer.echo(f"Erro ao obter vagas: {e}", err=True)
         raise typer.Exit(code=1)
 
-    typer.echo(json.dumps(jobs, indent=2, ensure_ascii=False))
+    _echo_json(jobs)
 
     if csv_path:
         try:
@@ -572,12 +803,12 @@ def search(
             extra["page"] = page
 
         resp = search_jobs(q, limit=limit, extra_params=extra)
-        data = resp.json()
+        data = _loads(resp.content)
     except Exception as e:
         typer.echo(f"Erro ao pesquisar: {e}", err=True)
         raise typer.Exit(code=1)
 
-    typer.echo(json.dumps(data, indent=2, ensure_ascii=False))
+    _echo_json(data)
 
 
 @app.command("type")
@@ -588,7 +819,7 @@ def work_type(job_id: str = typer.Argument(..., help="ID da vaga (obrigatório)"
     """
     try:
         resp = get_job(job_id)
-        data = resp.json()
+        data = _loads(resp.content)
         regime = extract_work_regime(data)
         typer.echo(regime)
     except Exception as e:
@@ -615,13 +846,13 @@ def list_company(
         }
         # Usar company como query para aumentar probabilidade de resultados relevantes
         resp = search_jobs(company, limit=limit, extra_params=extra)
-        data = resp.json()
+        data = _loads(resp.content)
         jobs = _extract_jobs_from_response(data)
     except Exception as e:
         typer.echo(f"Erro ao obter vagas: {e}", err=True)
         raise typer.Exit(code=1)
 
-    typer.echo(json.dumps(jobs, indent=2, ensure_ascii=False))
+    _echo_json(jobs)
 
     if csv_path:
         try:
@@ -643,21 +874,6 @@ def skills(
 
     Exemplo: `python jobscli.py skills 2025-01-01 2025-06-30 --limit 1000`
     """
-    # Lista de skills por omissão (podes estender)
-    skills_list = [
-        "python",
-        "java",
-        "javascript",
-        "c#",
-        "php",
-        "sql",
-        "aws",
-        "docker",
-        "kubernetes",
-        "react",
-        "angular",
-    ]
-
     try:
         s_date = date.fromisoformat(start_date)
         e_date = date.fromisoformat(end_date)
@@ -667,7 +883,7 @@ def skills(
 
     try:
         resp = list_jobs(limit)
-        data = resp.json()
+        data = _loads(resp.content)
         jobs = _extract_jobs_from_response(data)
     except Exception as e:
         typer.echo(f"Erro ao obter vagas: {e}", err=True)
@@ -675,17 +891,15 @@ def skills(
 
     # filtrar por data de publicação (tentar encontrar YYYY-MM-DD em job)
     matched_jobs = []
-    counts: Dict[str, int] = {k: 0 for k in skills_list}
+    counts: Counter = Counter(dict.fromkeys(_SKILLS_LIST, 0))
 
-    date_re = re.compile(r"(\d{4}-\d{2}-\d{2})")
     for job in jobs:
-        text = json.dumps(job).lower()
-        m = date_re.search(text)
-        if not m:
-            continue
+        # ler a data diretamente dos campos conhecidos, sem serializar a vaga
+        raw = job.get("publishedAt") or job.get("date") or job.get("date_published") or job.get("published_at")
         try:
-            jd = date.fromisoformat(m.group(1))
-        except Exception:
+            jd = date.fromisoformat(raw[:10])
+        except (TypeError, ValueError):
+            # sem data (ou em formato inesperado): a vaga não entra no intervalo
             continue
 
         if not (s_date <= jd <= e_date):
@@ -693,15 +907,10 @@ def skills(
 
         # vaga dentro do intervalo: contar skills
         content = (str(job.get("title", "")) + " " + str(job.get("description", ""))).lower()
-        found = False
-        for skill in skills_list:
-            # matching com word boundaries
-            matches = re.findall(r"\b" + re.escape(skill) + r"\b", content)
-            if matches:
-                counts[skill] += len(matches)
-                found = True
-
+        found = _SKILLS_RE.findall(content)
         if found:
+            # o texto já está em minúsculas: os matches contam-se tal como vêm
+            counts.update(found)
             matched_jobs.append(job)
 
     # ordenar desc e devolver dict único dentro de lista, como pedido
@@ -713,7 +922,7 @@ def skills(
         )
     )
 
-    typer.echo(json.dumps([ordered], indent=2, ensure_ascii=False))
+    _echo_json([ordered])
 
     if csv_path:
         try:
@@ -743,7 +952,7 @@ def get(
     """
     try:
         resp = get_job(job_id)
-        data = resp.json()
+        data = _loads(resp.content)
 
         # A API às vezes devolve wrapper; tentar localizar o dict da vaga
         job_obj = data
@@ -754,7 +963,7 @@ def get(
                     break
 
         enriched = enrich_job_with_teamlyzer(job_obj, fallback_pages=teamlyzer_pages)
-        typer.echo(json.dumps(enriched, indent=2, ensure_ascii=False))
+        _echo_json(enriched)
 
         # exportar para CSV (alínea d)
         if csv_path:
@@ -784,40 +993,41 @@ def statistics(
     # 1) obter lista (IDs)
     try:
         resp = list_jobs(limit)
-        data = resp.json()
+        data = _loads(resp.content)
         jobs = _extract_jobs_from_response(data)
     except Exception as e:
         typer.echo(f"Erro ao obter lista de vagas: {e}", err=True)
         raise typer.Exit(code=1)
 
-    counts: Dict[tuple, int] = {}
-
-    # 2) para cada vaga, obter detalhe (get.json) e extrair zona/tipo
-    for j in jobs:
-        job_id = j.get("id") or j.get("job_id")
-        if not job_id:
-            continue
-
+    # 2) para cada vaga, obter detalhe (get.json) em paralelo e extrair zona/tipo
+    def _fetch_one(job_id: str) -> Optional[tuple]:
         try:
-            detail = get_job(str(job_id)).json()
+            detail = _loads(get_job(job_id).content)
 
             # por vezes vem embrulhado
-            job_obj = detail
             if isinstance(detail, dict):
                 for k in ("job", "data", "result"):
                     if isinstance(detail.get(k), dict):
-                        job_obj = detail[k]
+                        detail = detail[k]
                         break
-
-            zone = _extract_zone_from_job(job_obj)
-            job_type = _extract_type_from_job(job_obj)
-
-            key = (zone, job_type)
-            counts[key] = counts.get(key, 0) + 1
-
+            else:
+                # detalhe num formato inesperado (ex.: lista): ignorar a vaga, como as restantes falhas
+                return None
+            return _extract_zone_from_job(detail), _extract_type_from_job(detail)
         except Exception:
-            # se falhar uma vaga, ignorar e continuar
-            continue
+            # se falhar uma vaga (pedido, JSON ou extração), ignorar e continuar
+            return None
+
+    # cada ID é pedido uma só vez; a multiplicidade na listagem mantém as contagens corretas
+    id_counts = Counter(str(j.get("id") or j.get("job_id")) for j in jobs if j.get("id") or j.get("job_id"))
+    job_ids = list(id_counts)
+
+    counts: Counter = Counter()
+    with ThreadPoolExecutor(max_workers=STATISTICS_WORKERS) as ex:
+        # a agregação fica na thread principal, sem precisar de lock
+        for job_id, key in zip(job_ids, ex.map(_fetch_one, job_ids)):
+            if key is not None:
+                counts[key] += id_counts[job_id]
 
     # 3) exportar CSV
     try: